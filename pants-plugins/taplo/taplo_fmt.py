@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import os.path
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable, Sequence
 
 from pants.core.goals.fmt import (
+    FmtFilesRequest,
+    FmtRequest,
     FmtResult,
     FmtTargetsRequest,
-    FmtFilesRequest,
     Partitions,
 )
 from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
@@ -17,18 +18,55 @@ from pants.core.util_rules.external_tool import (
     TemplatedExternalTool,
 )
 from pants.core.util_rules.partitions import PartitionerType
-from pants.engine.fs import Digest, MergeDigests
+from pants.engine.fs import Digest, MergeDigests, Snapshot
 from pants.engine.platform import Platform
 from pants.engine.process import Process, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import BoolField, FieldSet, Target
 from pants.option.option_types import ArgsListOption, BoolOption, SkipOption
 from pants.util.logging import LogLevel
-from pants.util.memo import memoized
+from pants.util.memo import memoized_method
 from pants.util.strutil import pluralize, softwrap
 
 from .toml_sources import TomlSourceField, TomlSourcesGeneratorTarget, TomlSourceTarget
 
+# Conservative cap on the combined length of the file arguments given to a
+# single taplo process, well under the smallest common ARG_MAX (256 KiB on macOS).
+_MAX_FILES_ARGV_LENGTH = 100_000
+
+
+@lru_cache(maxsize=128)
+def _build_config_request(
+    config_discovery: bool, dirs: frozenset[str]
+) -> ConfigFilesRequest:
+    roots = ("", *sorted(dirs))
+    candidates = tuple(
+        dict.fromkeys(
+            f"{d}/{name}" if d else name
+            for name in (".taplo.toml", "taplo.toml")
+            for d in roots
+        )
+    )
+    return ConfigFilesRequest(
+        discovery=config_discovery,
+        check_existence=candidates,
+    )
+
+
+def _chunk_files(files: Iterable[str]) -> list[tuple[str, ...]]:
+    chunks: list[tuple[str, ...]] = []
+    chunk: list[str] = []
+    length = 0
+    for f in files:
+        if chunk and length + len(f) + 1 > _MAX_FILES_ARGV_LENGTH:
+            chunks.append(tuple(chunk))
+            chunk, length = [], 0
+        chunk.append(f)
+        length += len(f) + 1
+    if chunk:
+        chunks.append(tuple(chunk))
+    return chunks
+
 
 class Taplo(TemplatedExternalTool):
     help = "An autoformatter for TOML files (https://taplo.tamasfe.dev/)"
@@ -62,20 +100,20 @@ class Taplo(TemplatedExternalTool):
         ),
     )
 
+    @memoized_method
     def generate_exe(self, plat: Platform) -> str:
         return f"./{self.generate_url(plat).rsplit('/', 1)[-1].removesuffix('.gz')}"
 
     def config_request(self, dirs: Iterable[str]) -> ConfigFilesRequest:
-        candidates = [os.path.join(d, ".taplo.toml") for d in ("", *dirs)]
-        candidates.extend(os.path.join(d, "taplo.toml") for d in ("", *dirs))
-        return ConfigFilesRequest(
-            discovery=self.config_discovery,
-            check_existence=candidates,
-        )
+        return _build_config_request(self.config_discovery, frozenset(dirs))
 
     def pyproject_checker(self, filepaths: Sequence[str]) -> list[str]:
-        paths = set(filepaths)
-        return [f for f in paths if "pyproject.toml" in f]
+        # Pants paths are always relative and `/`-separated.
+        return [
+            f
+            for f in filepaths
+            if f == "pyproject.toml" or f.endswith("/pyproject.toml")
+        ]
 
 
 class SkipTaploField(BoolField):
@@ -102,21 +140,40 @@ class TaploFmtRequest(FmtTargetsRequest):
     partitioner_type = PartitionerType.DEFAULT_SINGLE_PARTITION
 
 
-@rule(desc="Format with taplo", level=LogLevel.DEBUG)
-async def taplo_fmt(
-    request: TaploFmtRequest.Batch, taplo: Taplo, platform: Platform
-) -> FmtResult:
-    download_taplo_get = Get(
-        DownloadedExternalTool,
-        ExternalToolRequest,
-        taplo.get_request(platform),
-    )
-    config_files_get = Get(
-        ConfigFiles, ConfigFilesRequest, taplo.config_request(request.snapshot.dirs)
+class DownloadedTaplo(DownloadedExternalTool):
+    pass
+
+
+@rule(desc="Download taplo", level=LogLevel.DEBUG)
+async def download_taplo(taplo: Taplo, platform: Platform) -> DownloadedTaplo:
+    downloaded = await Get(
+        DownloadedExternalTool, ExternalToolRequest, taplo.get_request(platform)
     )
+    return DownloadedTaplo(downloaded.digest, downloaded.exe)
+
+
+async def _run_taplo(
+    request: FmtRequest.Batch, taplo: Taplo, platform: Platform
+) -> FmtResult:
+    if not request.files:
+        return FmtResult(
+            input=request.snapshot,
+            output=request.snapshot,
+            stdout="",
+            stderr="",
+            tool_name=request.tool_name,
+        )
+
+    chunks = _chunk_files(request.files)
     downloaded_taplo, config_digest = await MultiGet(
-        download_taplo_get, config_files_get
+        Get(DownloadedTaplo, Platform, platform),
+        Get(
+            ConfigFiles,
+            ConfigFilesRequest,
+            taplo.config_request(request.snapshot.dirs),
+        ),
     )
+    argv_prefix = (downloaded_taplo.exe, "fmt", *taplo.args)
     input_digest = await Get(
         Digest,
         MergeDigests(
@@ -128,22 +185,38 @@ async def taplo_fmt(
         ),
     )
 
-    argv = [
-        downloaded_taplo.exe,
-        "fmt",
-        *taplo.args,
-        *request.files,
+    processes = [
+        Process(
+            argv=(*argv_prefix, *files),
+            input_digest=input_digest,
+            output_files=files,
+            description=f"Run taplo on {pluralize(len(files), 'file')}.",
+            level=LogLevel.DEBUG,
+        )
+        for files in chunks
     ]
-    process = Process(
-        argv=argv,
-        input_digest=input_digest,
-        output_files=request.files,
-        description=f"Run taplo on {pluralize(len(request.files), 'file')}.",
-        level=LogLevel.DEBUG,
+    results = await MultiGet(Get(ProcessResult, Process, p) for p in processes)
+    if len(results) == 1:
+        return await FmtResult.create(request, results[0])
+
+    # Only reached when a batch's file arguments exceed _MAX_FILES_ARGV_LENGTH,
+    # i.e. very long paths or a large `[fmt].batch_size`. This mirrors
+    # `FmtResult.create` for several process results, so keep the two in sync.
+    output = await Get(Snapshot, MergeDigests(r.output_digest for r in results))
+    return FmtResult(
+        input=request.snapshot,
+        output=output,
+        stdout="".join(r.stdout.decode() for r in results),
+        stderr="".join(r.stderr.decode() for r in results),
+        tool_name=request.tool_name,
     )
 
-    result = await Get(ProcessResult, Process, process)
-    return await FmtResult.create(request, result)
+
+@rule(desc="Format with taplo", level=LogLevel.DEBUG)
+async def taplo_fmt(
+    request: TaploFmtRequest.Batch, taplo: Taplo, platform: Platform
+) -> FmtResult:
+    return await _run_taplo(request, taplo, platform)
 
 
 class PyprojectFmtRequest(FmtFilesRequest):
@@ -157,51 +230,18 @@ async def partition_pyprojects(
     if taplo.skip:
         return Partitions()
 
-    return Partitions.single_partition(sorted(taplo.pyproject_checker(request.files)))
+    pyprojects = taplo.pyproject_checker(request.files)
+    if not pyprojects:
+        return Partitions()
+
+    return Partitions.single_partition(sorted(pyprojects))
 
 
 @rule(desc="Format pyproject.toml files", level=LogLevel.DEBUG)
 async def pyproject_toml_fmt(
     request: PyprojectFmtRequest.Batch, taplo: Taplo, platform: Platform
 ) -> FmtResult:
-    download_taplo_get = Get(
-        DownloadedExternalTool,
-        ExternalToolRequest,
-        taplo.get_request(platform),
-    )
-    config_files_get = Get(
-        ConfigFiles, ConfigFilesRequest, taplo.config_request(request.snapshot.dirs)
-    )
-    downloaded_taplo, config_digest = await MultiGet(
-        download_taplo_get, config_files_get
-    )
-    input_digest = await Get(
-        Digest,
-        MergeDigests(
-            (
-                request.snapshot.digest,
-                downloaded_taplo.digest,
-                config_digest.snapshot.digest,
-            )
-        ),
-    )
-
-    argv = [
-        downloaded_taplo.exe,
-        "fmt",
-        *taplo.args,
-        *request.files,
-    ]
-    process = Process(
-        argv=argv,
-        input_digest=input_digest,
-        output_files=request.files,
-        description=f"Run taplo on {pluralize(len(request.files), 'file')}.",
-        level=LogLevel.DEBUG,
-    )
-
-    result = await Get(ProcessResult, Process, process)
-    return await FmtResult.create(request, result)
+    return await _run_taplo(request, taplo, platform)
 
 
 def rules():
@@ -30,6 +30,8 @@ from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
+_TOML_EXTS: tuple[str, ...] = (".toml",)
+
 
 class TomlSetup(Subsystem):
     options_scope = "toml-setup"
@@ -47,7 +49,7 @@ class TomlSetup(Subsystem):
 
 
 class TomlSourceField(FileSourceField):
-    expected_file_extensions: ClassVar[tuple[str, ...]] = (".toml",)
+    expected_file_extensions: ClassVar[tuple[str, ...]] = _TOML_EXTS
 
 
 class TomlDependenciesField(Dependencies):
@@ -63,7 +65,7 @@ class TomlSourceTarget(Target):
 class TomlSourcesGeneratingSourcesField(MultipleSourcesField):
     default = ("*.toml",)
     uses_source_roots = False
-    expected_file_extensions: ClassVar[tuple[str, ...]] = (".toml",)
+    expected_file_extensions: ClassVar[tuple[str, ...]] = _TOML_EXTS
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['pyproject.toml', 'config.toml']`"
     )
@@ -107,19 +109,18 @@ async def find_putative_targets(
     if not toml_setup.tailor:
         return PutativeTargets()
     all_toml_files = await Get(Paths, PathGlobs, req.path_globs("*.toml"))
-    unowned_toml_files = set(all_toml_files.files) - set(all_owned_sources)
+    unowned_toml_files = set(all_toml_files.files).difference(all_owned_sources)
     logger.debug(unowned_toml_files)
     pts = []
-    for paths in unowned_toml_files:
-        for dirname, filenames in group_by_dir(paths).items():
-            pts.append(
-                PutativeTarget.for_target_type(
-                    TomlSourcesGeneratorTarget,
-                    path=dirname,
-                    name=None,
-                    triggering_sources=sorted(filenames),
-                )
+    for dirname, filenames in group_by_dir(unowned_toml_files).items():
+        pts.append(
+            PutativeTarget.for_target_type(
+                TomlSourcesGeneratorTarget,
+                path=dirname,
+                name=None,
+                triggering_sources=sorted(filenames),
             )
+        )
     return PutativeTargets(pts)
 
 